@@ -0,0 +1,73 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import json
+import os
+
+# compiling a json schema is much more expensive than validating against it: compile each
+# schema once per process and reuse the validator for every validate call (configs are
+# validated against the same profile schema once per profile)
+_VALIDATORS_BY_SCHEMA_PATH = {}
+
+
+def get_validator(schema_path):
+    signature = _schema_signature(schema_path)
+    cached_signature, validator = _VALIDATORS_BY_SCHEMA_PATH.get(schema_path, (None, None))
+    if validator is not None and cached_signature == signature:
+        return validator
+    validator = _compile_validator(schema_path)
+    _VALIDATORS_BY_SCHEMA_PATH[schema_path] = (signature, validator)
+    return validator
+
+
+def patch_config_validation():
+    # best effort: replace octobot_commons.json_util.validate with a version reusing
+    # compiled validators, keep the original behavior when anything goes wrong
+    try:
+        import octobot_commons.json_util as json_util
+    except ImportError:
+        return
+    if getattr(json_util.validate, "_schema_cache_patch", False):
+        return
+    original_validate = json_util.validate
+
+    def _cached_validate(config, schema_file):
+        try:
+            validator = get_validator(schema_file)
+        except Exception:
+            return original_validate(config, schema_file)
+        validator.validate(config)
+
+    _cached_validate._schema_cache_patch = True
+    json_util.validate = _cached_validate
+
+
+def clear_cache():
+    _VALIDATORS_BY_SCHEMA_PATH.clear()
+
+
+def _schema_signature(schema_path):
+    stats = os.stat(schema_path)
+    return stats.st_mtime_ns, stats.st_size
+
+
+def _compile_validator(schema_path):
+    import jsonschema
+
+    with open(schema_path) as schema_file:
+        schema = json.load(schema_file)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
@@ -0,0 +1,75 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import hashlib
+import json
+import os
+
+import octobot.constants as constants
+
+_MARKER_FILE = "validated.json"
+
+
+def get_cache_dir():
+    return os.path.join(os.path.expanduser("~"), ".cache", "octobot")
+
+
+def get_tracked_files(config):
+    # every file whose content can change the outcome of config.validate()
+    files = [constants.CONFIG_FILE_SCHEMA, constants.PROFILE_FILE_SCHEMA]
+    config_path = getattr(config, "config_path", None)
+    if config_path:
+        files.append(config_path)
+    profiles_path = getattr(config, "profiles_path", None)
+    if profiles_path and os.path.isdir(profiles_path):
+        for dir_path, _, file_names in os.walk(profiles_path):
+            for file_name in file_names:
+                if file_name.endswith(".json"):
+                    files.append(os.path.join(dir_path, file_name))
+    return files
+
+
+def is_validated(file_paths):
+    try:
+        with open(_marker_file_path()) as marker_file:
+            return _files_digest(file_paths) in json.load(marker_file)
+    except Exception:
+        # missing or unreadable marker: validate normally
+        return False
+
+
+def mark_validated(file_paths):
+    try:
+        os.makedirs(get_cache_dir(), exist_ok=True)
+        temp_file_path = f"{_marker_file_path()}.tmp"
+        with open(temp_file_path, "w") as marker_file:
+            json.dump({_files_digest(file_paths): constants.VERSION}, marker_file)
+        os.replace(temp_file_path, _marker_file_path())
+    except Exception:
+        # cache dir might not be writable: next startup will validate again
+        pass
+
+
+def _files_digest(file_paths):
+    digest = hashlib.blake2b(constants.VERSION.encode())
+    for file_path in sorted(file_paths):
+        digest.update(file_path.encode())
+        with open(file_path, "rb") as tracked_file:
+            digest.update(tracked_file.read())
+    return digest.hexdigest()
+
+
+def _marker_file_path():
+    return os.path.join(get_cache_dir(), _MARKER_FILE)
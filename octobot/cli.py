@@ -14,67 +14,52 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import argparse
+import dataclasses
 import os
 import sys
-import multiprocessing
-import asyncio
-import packaging.version as packaging_version
-
-import octobot_commons.os_util as os_util
-import octobot_commons.logging as logging
-import octobot_commons.configuration as configuration
-import octobot_commons.profiles as profiles
-import octobot_commons.authentication as authentication
-import octobot_commons.constants as common_constants
-import octobot_commons.errors as errors
-
-import octobot_services.api as service_api
-
-import octobot_tentacles_manager.api as tentacles_manager_api
-import octobot_tentacles_manager.cli as tentacles_manager_cli
-import octobot_tentacles_manager.constants as tentacles_manager_constants
 
 # make tentacles importable
 sys.path.append(os.path.dirname(sys.executable))
 
-import octobot.octobot as octobot_class
-import octobot.commands as commands
-import octobot.configuration_manager as configuration_manager
-import octobot.octobot_backtesting_factory as octobot_backtesting
+# Other modules (octobot_commons, octobot_services, octobot_tentacles_manager and octobot submodules)
+# are imported inside the functions that need them: importing them here would make every command,
+# including "--version" and "tentacles", pay for the whole bot import chain.
 import octobot.constants as constants
-import octobot.disclaimer as disclaimer
-import octobot.logger as octobot_logger
-import octobot.community as octobot_community
-import octobot.community.errors
-import octobot.limits as limits
 
 
-def update_config_with_args(starting_args, config: configuration.Configuration, logger):
-    try:
-        import octobot_backtesting.constants as backtesting_constants
-    except ImportError as e:
-        logging.get_logger().error(
-            "Can't start backtesting without the octobot_backtesting package properly installed.")
-        raise e
+def update_config_with_args(starting_args, config, logger):
+    import octobot_commons.constants as common_constants
 
+    dict_config = config.config
     if starting_args.backtesting:
+        try:
+            import octobot_backtesting.constants as backtesting_constants
+        except ImportError as e:
+            import octobot_commons.logging as logging
+            logging.get_logger().error(
+                "Can't start backtesting without the octobot_backtesting package properly installed.")
+            raise e
+        backtesting_config = dict_config[backtesting_constants.CONFIG_BACKTESTING]
         if starting_args.backtesting_files:
-            config.config[backtesting_constants.CONFIG_BACKTESTING][
-                backtesting_constants.CONFIG_BACKTESTING_DATA_FILES] = starting_args.backtesting_files
-        config.config[backtesting_constants.CONFIG_BACKTESTING][common_constants.CONFIG_ENABLED_OPTION] = True
-        config.config[common_constants.CONFIG_TRADER][common_constants.CONFIG_ENABLED_OPTION] = False
-        config.config[common_constants.CONFIG_SIMULATOR][common_constants.CONFIG_ENABLED_OPTION] = True
+            backtesting_config[backtesting_constants.CONFIG_BACKTESTING_DATA_FILES] = starting_args.backtesting_files
+        backtesting_config[common_constants.CONFIG_ENABLED_OPTION] = True
+        dict_config[common_constants.CONFIG_TRADER][common_constants.CONFIG_ENABLED_OPTION] = False
+        dict_config[common_constants.CONFIG_SIMULATOR][common_constants.CONFIG_ENABLED_OPTION] = True
 
     if starting_args.simulate:
-        config.config[common_constants.CONFIG_TRADER][common_constants.CONFIG_ENABLED_OPTION] = False
-        config.config[common_constants.CONFIG_SIMULATOR][common_constants.CONFIG_ENABLED_OPTION] = True
+        dict_config[common_constants.CONFIG_TRADER][common_constants.CONFIG_ENABLED_OPTION] = False
+        dict_config[common_constants.CONFIG_SIMULATOR][common_constants.CONFIG_ENABLED_OPTION] = True
 
-    if starting_args.risk is not None and 0 < starting_args.risk <= 1:
-        config.config[common_constants.CONFIG_TRADING][common_constants.CONFIG_TRADER_RISK] = starting_args.risk
+    risk = starting_args.risk
+    if risk is not None and 0 < risk <= 1:
+        dict_config[common_constants.CONFIG_TRADING][common_constants.CONFIG_TRADER_RISK] = risk
 
 
-def _log_terms_if_unaccepted(config: configuration.Configuration, logger):
+def _log_terms_if_unaccepted(config, logger):
     if not config.accepted_terms():
+        # only pay for the disclaimer module when the terms are not accepted yet
+        import octobot.disclaimer as disclaimer
+
         logger.info("*** Disclaimer ***")
         for line in disclaimer.DISCLAIMER:
             logger.info(line)
@@ -84,6 +69,8 @@ def _log_terms_if_unaccepted(config: configuration.Configuration, logger):
 
 
 def _disable_interface_from_param(interface_identifier, param_value, logger):
+    import octobot_services.api as service_api
+
     if param_value:
         if service_api.disable_interfaces(interface_identifier) == 0:
             logger.warning("No " + interface_identifier + " interface to disable")
@@ -92,6 +79,15 @@ def _disable_interface_from_param(interface_identifier, param_value, logger):
 
 
 def _log_environment(logger):
+    import logging
+
+    if not logger.isEnabledFor(logging.INFO):
+        # skip the platform probes (os-release, platform.uname(), ...) when the
+        # message would not be emitted anyway
+        return
+
+    import octobot_commons.os_util as os_util
+
     try:
         bot_type = "cloud" if constants.IS_CLOUD_ENV else "self-hosted"
         logger.info(f"Running {bot_type} OctoBot on {os_util.get_current_platform()} "
@@ -102,6 +98,9 @@ def _log_environment(logger):
 
 
 def _create_configuration():
+    import octobot_commons.configuration as configuration
+    import octobot_commons.constants as common_constants
+
     config_path = configuration.get_user_config()
     config = configuration.Configuration(config_path,
                                          common_constants.USER_PROFILES_FOLDER,
@@ -111,7 +110,15 @@ def _create_configuration():
 
 
 def _create_startup_config(logger):
+    import octobot_commons.errors as errors
+    import octobot_tentacles_manager.constants as tentacles_manager_constants
+    import octobot.commands as commands
+    import octobot.configuration_manager as configuration_manager
+    import octobot._schema_cache as schema_cache
+
     logger.info("Loading config files...")
+    # reuse compiled config and profile schemas across launches
+    schema_cache.patch_config_validation()
     config = _create_configuration()
     is_first_startup = config.is_config_file_empty_or_missing()
     if is_first_startup:
@@ -131,6 +138,10 @@ def _create_startup_config(logger):
 
 
 async def _apply_community_startup_info_to_config(logger, config, community_auth):
+    import octobot_commons.authentication as authentication
+    import octobot.commands as commands
+    import octobot.community.errors
+
     try:
         startup_info = await community_auth.get_startup_info()
         logger.debug(f"Fetched startup info: {startup_info}")
@@ -139,7 +150,7 @@ async def _apply_community_startup_info_to_config(logger, config, community_auth
             startup_info.subscribed_products_urls,
             startup_info.forced_profile_url
         )
-    except octobot_community.errors.BotError:
+    except octobot.community.errors.BotError:
         return
     except authentication.FailedAuthentication as err:
         logger.error(f"Failed authentication when fetching bot startup info: {err}")
@@ -148,6 +159,11 @@ async def _apply_community_startup_info_to_config(logger, config, community_auth
 
 
 async def _apply_db_bot_config(logger, config, community_auth) -> bool:
+    import octobot_commons.errors as errors
+    import octobot_commons.profiles as profiles
+    import octobot.commands as commands
+    import octobot.community.errors
+
     try:
         # async loop may have changed if community_auth was already used before
         await community_auth.ensure_async_loop()
@@ -183,6 +199,8 @@ async def _apply_db_bot_config(logger, config, community_auth) -> bool:
 
 
 def _apply_env_variables_to_config(logger, config):
+    import octobot.commands as commands
+
     commands.download_and_select_profile(
         logger, config,
         [url.strip() for url in constants.TO_DOWNLOAD_PROFILES.split(",")] if constants.TO_DOWNLOAD_PROFILES else [],
@@ -191,6 +209,10 @@ def _apply_env_variables_to_config(logger, config):
 
 
 async def _get_authenticated_community_if_possible(config, logger):
+    import octobot_commons.authentication as authentication
+    import octobot_tentacles_manager.api as tentacles_manager_api
+    import octobot.community as octobot_community
+
     # switch environments if necessary
     octobot_community.IdentifiersProvider.use_environment_from_config(config)
     community_auth = octobot_community.CommunityAuthentication.create(config)
@@ -228,6 +250,8 @@ async def _get_authenticated_community_if_possible(config, logger):
 
 
 async def _async_load_community_data(community_auth, config, logger, is_first_startup):
+    import octobot_commons.authentication as authentication
+
     if constants.IS_CLOUD_ENV and is_first_startup:
         if not community_auth.is_logged_in():
             raise authentication.FailedAuthentication(
@@ -241,6 +265,8 @@ async def _async_load_community_data(community_auth, config, logger, is_first_st
 
 
 def _apply_forced_configs(community_auth, logger, config, is_first_startup):
+    import asyncio
+
     asyncio.run(_async_load_community_data(community_auth, config, logger, is_first_startup))
 
     # 2. handle profiles from env variables
@@ -248,19 +274,35 @@ def _apply_forced_configs(community_auth, logger, config, is_first_startup):
 
 
 def _read_config(config, logger):
+    import octobot_commons.errors as errors
+
     try:
         config.read(should_raise=True, fill_missing_fields=True)
     except errors.NoProfileError:
         _repair_with_default_profile(config, logger)
-        config = _create_configuration()
+        # the repair updated the config file: re-read it into the same instance
+        # instead of building and parsing a throwaway configuration
         config.read(should_raise=False, fill_missing_fields=True)
     except Exception as e:
         raise errors.ConfigError(e)
 
 
 def _validate_config(config, logger):
+    import octobot_commons.errors as errors
+    import octobot.configuration_manager as configuration_manager
+    import octobot._validation_cache as validation_cache
+
+    try:
+        tracked_files = validation_cache.get_tracked_files(config)
+        if validation_cache.is_validated(tracked_files):
+            # config and profiles are unchanged since the last successful validation
+            return
+    except Exception:
+        tracked_files = None
     try:
         config.validate()
+        if tracked_files:
+            validation_cache.mark_validated(tracked_files)
     except Exception as err:
         if configuration_manager.migrate_from_previous_config(config):
             logger.info("Your configuration has been migrated into the newest format.")
@@ -270,14 +312,94 @@ def _validate_config(config, logger):
 
 
 def _repair_with_default_profile(config, logger):
+    import octobot.configuration_manager as configuration_manager
+
     logger.error("OctoBot can't start without a valid profile configuration. Selecting default profile ...")
     configuration_manager.set_default_profile(config)
     config.load_profiles_if_possible_and_necessary()
 
 
+def _tentacles_cache_file():
+    import octobot._validation_cache as validation_cache
+
+    return os.path.join(validation_cache.get_cache_dir(), "tentacles_index.json")
+
+
+def _tentacles_fingerprint():
+    import octobot.tentacle_lazy as tentacle_lazy
+
+    return tentacle_lazy.get_tentacles_fingerprint()
+
+
+def _is_tentacles_cache_fresh():
+    import json
+
+    try:
+        with open(_tentacles_cache_file()) as cache_file:
+            return json.load(cache_file).get("fingerprint") == _tentacles_fingerprint()
+    except Exception:
+        return False
+
+
+def _save_tentacles_cache():
+    import json
+
+    try:
+        os.makedirs(os.path.dirname(_tentacles_cache_file()), exist_ok=True)
+        temp_file_path = f"{_tentacles_cache_file()}.tmp"
+        with open(temp_file_path, "w") as cache_file:
+            json.dump({"fingerprint": _tentacles_fingerprint()}, cache_file)
+        os.replace(temp_file_path, _tentacles_cache_file())
+    except Exception:
+        # cache dir might not be writable: next startup will re-verify tentacles
+        pass
+
+
+def _invalidate_tentacles_cache():
+    try:
+        os.remove(_tentacles_cache_file())
+    except OSError:
+        pass
+
+
+def _refresh_tentacles_cache(community_auth, tentacles_setup_config, logger):
+    import octobot_tentacles_manager.api as tentacles_manager_api
+    import octobot.community.tentacles_packages as community_tentacles_packages
+
+    try:
+        pending_changes = not tentacles_manager_api.are_tentacles_up_to_date(
+            tentacles_setup_config, constants.VERSION
+        )
+        if not pending_changes and community_auth is not None:
+            # also check for pending community tentacle package installs and removals,
+            # which the fingerprint cannot see as they are not local changes
+            to_install_urls, to_remove_tentacles, force_refresh_tentacles_setup_config = \
+                community_tentacles_packages.get_to_install_and_remove_tentacles(
+                    community_auth, tentacles_setup_config, constants.LONG_VERSION
+                )
+            pending_changes = bool(to_install_urls or to_remove_tentacles or force_refresh_tentacles_setup_config)
+        if pending_changes:
+            _invalidate_tentacles_cache()
+            logger.info("Installed tentacles require an update: they will be updated on next startup.")
+        else:
+            _save_tentacles_cache()
+    except Exception as err:
+        _invalidate_tentacles_cache()
+        logger.warning(f"Error when refreshing tentacles cache: {err}")
+
+
 def _load_or_create_tentacles(community_auth, config, logger):
+    import threading
+
+    import octobot_tentacles_manager.api as tentacles_manager_api
+    import octobot_tentacles_manager.constants as tentacles_manager_constants
+    import octobot.commands as commands
+
     # add tentacles folder to Python path
-    sys.path.append(os.path.realpath(os.getcwd()))
+    # os.getcwd() is already absolute: avoid realpath's per-component lstat calls
+    cwd = os.getcwd()
+    if cwd not in sys.path:
+        sys.path.append(cwd)
 
     if os.path.isfile(tentacles_manager_constants.USER_REFERENCE_TENTACLE_CONFIG_FILE_PATH):
         # when tentacles folder already exists
@@ -285,7 +407,22 @@ def _load_or_create_tentacles(community_auth, config, logger):
         tentacles_setup_config = tentacles_manager_api.get_tentacles_setup_config(
             config.get_tentacles_config_path()
         )
-        commands.run_update_or_repair_tentacles_if_necessary(community_auth, config, tentacles_setup_config)
+        if _is_tentacles_cache_fresh():
+            # this exact tentacles install has already been verified: serve it right away
+            # and re-verify in the background (stale-while-revalidate)
+            threading.Thread(
+                target=_refresh_tentacles_cache,
+                args=(community_auth, tentacles_setup_config, logger),
+                daemon=True,
+                name="TentaclesCacheRefresh",
+            ).start()
+            if not tentacles_manager_api.load_tentacles(verbose=True):
+                _invalidate_tentacles_cache()
+                commands.run_update_or_repair_tentacles_if_necessary(community_auth, config, tentacles_setup_config)
+                _save_tentacles_cache()
+        else:
+            commands.run_update_or_repair_tentacles_if_necessary(community_auth, config, tentacles_setup_config)
+            _save_tentacles_cache()
     else:
         # when no tentacles folder has been found
         logger.info("OctoBot tentacles can't be found. Installing default tentacles ...")
@@ -294,25 +431,43 @@ def _load_or_create_tentacles(community_auth, config, logger):
 
 
 def start_octobot(args):
+    if args.version:
+        print(constants.LONG_VERSION)
+        return
+
+    import asyncio
+    import concurrent.futures
+
+    import octobot_commons.constants as common_constants
+    import octobot_commons.errors as errors
+    import octobot_tentacles_manager.constants as tentacles_manager_constants
+    import octobot.commands as commands
+    import octobot.community as octobot_community
+    import octobot.configuration_manager as configuration_manager
+    import octobot.limits as limits
+    import octobot.logger as octobot_logger
+
     logger = None
     try:
-        if args.version:
-            print(constants.LONG_VERSION)
-            return
-
         logger = octobot_logger.init_logger()
         startup_messages = []
 
         # Version
         logger.info("Version : {0}".format(constants.LONG_VERSION))
 
-        # Current running environment
-        _log_environment(logger)
+        # Current running environment logging and error tracker init are independent
+        # of configuration loading: overlap them with config files reading
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="StartupTasks"
+        ) as startup_executor:
+            environment_log = startup_executor.submit(_log_environment, logger)
+            sentry_init = startup_executor.submit(octobot_community.init_sentry_tracker)
 
-        octobot_community.init_sentry_tracker()
+            # load configuration
+            config, is_first_startup = _create_startup_config(logger)
 
-        # load configuration
-        config, is_first_startup = _create_startup_config(logger)
+            environment_log.result()
+            sentry_init.result()
 
         # check config loading
         if not config.is_loaded():
@@ -348,11 +503,13 @@ def start_octobot(args):
 
         # create OctoBot instance
         if args.backtesting:
+            import octobot.octobot_backtesting_factory as octobot_backtesting
             bot = octobot_backtesting.OctoBotBacktestingFactory(config,
                                                                 run_on_common_part_only=not args.whole_data_range,
                                                                 enable_join_timeout=args.enable_backtesting_timeout,
                                                                 enable_logs=not args.no_logs)
         else:
+            import octobot.octobot as octobot_class
             bot = octobot_class.OctoBot(config, community_authenticator=community_auth,
                                         reset_trading_history=args.reset_trading_history,
                                         startup_messages=startup_messages)
@@ -419,7 +576,27 @@ def start_octobot(args):
         os._exit(-1)
 
 
-def octobot_parser(parser):
+_TENTACLES_SUBCOMMAND_HELP = 'Calls OctoBot tentacles manager.\n' \
+                             'Use "tentacles --help" to get the ' \
+                             'tentacles manager help.'
+
+
+def _call_tentacles_manager(command_args):
+    # import the tentacles manager stack on demand only: other commands don't need it
+    import octobot.commands as commands
+
+    commands.call_tentacles_manager(command_args)
+
+
+def _register_tentacles_subparser(subparsers):
+    import octobot_tentacles_manager.cli as tentacles_manager_cli
+
+    tentacles_parser = subparsers.add_parser("tentacles", help=_TENTACLES_SUBCOMMAND_HELP)
+    tentacles_manager_cli.register_tentacles_manager_arguments(tentacles_parser)
+    tentacles_parser.set_defaults(func=_call_tentacles_manager)
+
+
+def octobot_parser(parser, args=None):
     parser.add_argument('-v', '--version', help='Show OctoBot current version.',
                         action='store_true')
     parser.add_argument('-s', '--simulate', help='Force OctoBot to start with the trader simulator only.',
@@ -475,12 +652,58 @@ def octobot_parser(parser):
     # add sub commands
     subparsers = parser.add_subparsers(title="Other commands")
 
-    # tentacles manager
-    tentacles_parser = subparsers.add_parser("tentacles", help='Calls OctoBot tentacles manager.\n'
-                                                               'Use "tentacles --help" to get the '
-                                                               'tentacles manager help.')
-    tentacles_manager_cli.register_tentacles_manager_arguments(tentacles_parser)
-    tentacles_parser.set_defaults(func=commands.call_tentacles_manager)
+    # tentacles manager: only build the real subparser when the tentacles command might
+    # be invoked as registering its arguments imports the tentacles manager CLI.
+    # "tentacles" appearing as an option value is a false positive that merely
+    # costs the import
+    if args is None or "tentacles" in args:
+        _register_tentacles_subparser(subparsers)
+    else:
+        # help-only entry: keeps the subcommand listed in --help without the import
+        subparsers.add_parser("tentacles", help=_TENTACLES_SUBCOMMAND_HELP)
+
+
+_MP_CONTEXT = None
+
+
+def _get_multiprocessing_context():
+    # multiprocessing is only imported when a bot subprocess is actually spawned:
+    # the import itself pulls pickle, socket and synchronization primitives
+    import multiprocessing
+
+    global _MP_CONTEXT
+    if _MP_CONTEXT is None:
+        try:
+            _MP_CONTEXT = multiprocessing.get_context("forkserver")
+            # pre-import the heavy bot packages once in the forkserver so every
+            # subsequent bot subprocess starts from an already-imported base
+            _MP_CONTEXT.set_forkserver_preload(["octobot", "octobot_commons", "octobot_services"])
+        except ValueError:
+            # forkserver is not available on this platform (e.g. Windows)
+            _MP_CONTEXT = multiprocessing.get_context()
+    return _MP_CONTEXT
+
+
+@dataclasses.dataclass(slots=True)
+class _StartArgs:
+    # attribute-compatible with the argparse.Namespace read by start_octobot, without
+    # the per-instance __dict__ allocation when bots are started programmatically
+    version: bool = False
+    update: bool = False
+    encrypter: bool = False
+    strategy_optimizer: bool = False
+    data_collector: bool = False
+    backtesting_files: list = None
+    no_telegram: bool = False
+    no_web: bool = False
+    no_logs: bool = False
+    backtesting: bool = False
+    identifier: list = None
+    whole_data_range: bool = True
+    enable_backtesting_timeout: bool = True
+    simulate: bool = True
+    risk: float = None
+    reset_trading_history: bool = False
 
 
 def start_background_octobot_with_args(version=False,
@@ -502,24 +725,24 @@ def start_background_octobot_with_args(version=False,
                                        reset_trading_history=False,):
     if backtesting_files is None:
         backtesting_files = []
-    args = argparse.Namespace(version=version,
-                              update=update,
-                              encrypter=encrypter,
-                              strategy_optimizer=strategy_optimizer,
-                              data_collector=data_collector,
-                              backtesting_files=backtesting_files,
-                              no_telegram=no_telegram,
-                              no_web=no_web,
-                              no_logs=no_logs,
-                              backtesting=backtesting,
-                              identifier=identifier,
-                              whole_data_range=whole_data_range,
-                              enable_backtesting_timeout=enable_backtesting_timeout,
-                              simulate=simulate,
-                              risk=risk,
-                              reset_trading_history=reset_trading_history)
+    args = _StartArgs(version=version,
+                      update=update,
+                      encrypter=encrypter,
+                      strategy_optimizer=strategy_optimizer,
+                      data_collector=data_collector,
+                      backtesting_files=backtesting_files,
+                      no_telegram=no_telegram,
+                      no_web=no_web,
+                      no_logs=no_logs,
+                      backtesting=backtesting,
+                      identifier=identifier,
+                      whole_data_range=whole_data_range,
+                      enable_backtesting_timeout=enable_backtesting_timeout,
+                      simulate=simulate,
+                      risk=risk,
+                      reset_trading_history=reset_trading_history)
     if in_subprocess:
-        bot_process = multiprocessing.Process(target=start_octobot, args=(args,))
+        bot_process = _get_multiprocessing_context().Process(target=start_octobot, args=(args,))
         bot_process.start()
         return bot_process
     else:
@@ -529,13 +752,18 @@ def start_background_octobot_with_args(version=False,
 def main(args=None):
     if not args:
         args = sys.argv[1:]
+    if args in (["-v"], ["--version"]):
+        # print the version without paying for the full parser construction
+        print(constants.LONG_VERSION)
+        return
     parser = argparse.ArgumentParser(description='OctoBot')
-    octobot_parser(parser)
+    octobot_parser(parser, args)
 
     MIN_TENTACLE_MANAGER_VERSION = "1.0.10"
 
     # check compatible tentacle manager
     try:
+        import packaging.version as packaging_version
         from octobot_tentacles_manager import VERSION
 
         if packaging_version.Version(VERSION) < packaging_version.Version(MIN_TENTACLE_MANAGER_VERSION):
@@ -15,10 +15,10 @@
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 
 
-DISCLAIMER = [
+DISCLAIMER = (
     "Do not risk money which you are afraid to lose. USE THE SOFTWARE AT YOUR OWN RISK. THE AUTHORS AND ALL "
     "AFFILIATES ASSUME NO RESPONSIBILITY FOR YOUR TRADING RESULTS.",
     "Always start by running a trading bot in simulation mode and do not engage money before you understand "
     "how it works and what profit/loss you should expect.",
-    "Do not hesitate to read the source code and understand the mechanism of this bot."
-]
+    "Do not hesitate to read the source code and understand the mechanism of this bot.",
+)
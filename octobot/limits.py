@@ -23,7 +23,6 @@ import octobot_commons.logging as logging
 import octobot_commons.time_frame_manager as time_frame_manager
 import octobot_tentacles_manager.api as tentacles_manager_api
 import octobot_evaluators.api as evaluators_api
-import octobot_trading.api as trading_api
 
 
 class ReachedLimitError(Exception):
@@ -31,36 +30,46 @@ class ReachedLimitError(Exception):
 
 
 def _apply_exchanges_limits(dict_config, logger, limit):
-    if len(trading_api.get_enabled_exchanges_names(dict_config)) > limit:
-        enabled_exchanges = []
-        for exchange, config in dict_config.get(common_constants.CONFIG_EXCHANGES, {}).items():
-            if config.get(common_constants.CONFIG_ENABLED_OPTION, True):
-                if len(enabled_exchanges) < limit:
-                    enabled_exchanges.append(exchange)
-                else:
-                    config[common_constants.CONFIG_ENABLED_OPTION] = False
-                    logger.error("Disabled " + exchange)
+    # single pass: count enabled exchanges and disable extra ones inline
+    enabled_option = common_constants.CONFIG_ENABLED_OPTION
+    enabled_exchanges = []
+    disabled_exchanges = []
+    for exchange, config in dict_config.get(common_constants.CONFIG_EXCHANGES, {}).items():
+        if config.get(enabled_option, True):
+            if len(enabled_exchanges) < limit:
+                enabled_exchanges.append(exchange)
+            else:
+                config[enabled_option] = False
+                disabled_exchanges.append(exchange)
+    if disabled_exchanges:
+        # one log call for every disabled exchange
+        logger.error(f"Disabled exchanges: {', '.join(disabled_exchanges)}")
         return f"Reached maximum allowed simultaneous exchanges for this plan, maximum is {limit}. " \
                f"Your OctoBot will trade on the following exchanges: {', '.join(enabled_exchanges)}"
     return ""
 
 
 def _apply_symbols_limits(dict_config, logger, limit):
+    # bind loop-invariant attribute lookups to locals
+    enabled_option = common_constants.CONFIG_ENABLED_OPTION
+    crypto_pairs = common_constants.CONFIG_CRYPTO_PAIRS
+    symbols_wildcard = common_constants.CONFIG_SYMBOLS_WILDCARD
     enabled_symbols = []
+    disabled_entries = []
     has_disabled_symbols = False
     message = ""
     for currency, crypto_currency_data in dict_config.get(common_constants.CONFIG_CRYPTO_CURRENCIES, {}).items():
-        if crypto_currency_data.get(common_constants.CONFIG_ENABLED_OPTION, True):
+        if crypto_currency_data.get(enabled_option, True):
             if len(enabled_symbols) >= limit:
-                crypto_currency_data[common_constants.CONFIG_ENABLED_OPTION] = False
-                logger.error(f"Disabled all {currency} trading pairs")
+                crypto_currency_data[enabled_option] = False
+                disabled_entries.append(f"all {currency} trading pairs")
                 has_disabled_symbols = True
                 continue
             updated_symbols = []
-            for symbol in crypto_currency_data.get(common_constants.CONFIG_CRYPTO_PAIRS, []):
-                if symbol == common_constants.CONFIG_SYMBOLS_WILDCARD[0] \
-                        or symbol == common_constants.CONFIG_SYMBOLS_WILDCARD:
-                    crypto_currency_data[common_constants.CONFIG_ENABLED_OPTION] = False
+            for symbol in crypto_currency_data.get(crypto_pairs, []):
+                if symbol == symbols_wildcard[0] \
+                        or symbol == symbols_wildcard:
+                    crypto_currency_data[enabled_option] = False
                     message = f"Disabled wildcard symbol for {currency}. "
                     has_disabled_symbols = True
                     break
@@ -70,8 +79,11 @@ def _apply_symbols_limits(dict_config, logger, limit):
                         updated_symbols.append(symbol)
                     else:
                         has_disabled_symbols = True
-                        logger.error(f"Disabled {symbol} trading pair from {currency}")
-            crypto_currency_data[common_constants.CONFIG_CRYPTO_PAIRS] = updated_symbols
+                        disabled_entries.append(f"{symbol} from {currency}")
+            crypto_currency_data[crypto_pairs] = updated_symbols
+    if disabled_entries:
+        # one log call for every disabled trading pair
+        logger.error(f"Disabled trading pairs: {', '.join(disabled_entries)}")
     if has_disabled_symbols:
         return f"{message}Reached maximum allowed simultaneous trading pairs for this plan, maximum is {limit}. " \
                f"Your OctoBot will trade following pairs: {', '.join(enabled_symbols)}."
@@ -80,40 +92,38 @@ def _apply_symbols_limits(dict_config, logger, limit):
 
 def _apply_time_frames_limits(full_config, logger, limit):
     tentacles_setup_config = tentacles_manager_api.get_tentacles_setup_config(full_config.get_tentacles_config_path())
+    sort_time_frames = time_frame_manager.sort_time_frames
     has_disabled_time_frames = False
-    all_enabled_time_frames = []
+    # track enabled time frames in a set: ordering is only required for the final
+    # summary message, a single sort at the end replaces one sort per strategy
+    enabled_time_frames = set()
     # patch time frames config
     for strategy_class in evaluators_api.get_activated_strategies_classes(tentacles_setup_config):
         config_time_frames = evaluators_api.get_time_frames_from_strategy(
             strategy_class, full_config.config, tentacles_setup_config
         )
-        combined_time_frames = set(all_enabled_time_frames + config_time_frames)
-        if len(combined_time_frames) < limit:
-            all_enabled_time_frames = time_frame_manager.sort_time_frames(list(combined_time_frames))
-        elif len(combined_time_frames) > limit:
+        new_time_frames = {
+            tf
+            for tf in config_time_frames
+            if tf not in enabled_time_frames
+        }
+        if len(enabled_time_frames) + len(new_time_frames) > limit:
             has_disabled_time_frames = True
-            if len(all_enabled_time_frames) == limit:
+            if len(enabled_time_frames) == limit:
                 # no timeframe to add
                 pass
             else:
                 # disable shortest timeframes first
-                missing_tf = time_frame_manager.sort_time_frames([
-                    tf
-                    for tf in config_time_frames
-                    if tf not in all_enabled_time_frames
-                ])
-                added_time_frames = missing_tf[limit-len(all_enabled_time_frames):]
-                all_enabled_time_frames = time_frame_manager.sort_time_frames(
-                    list(all_enabled_time_frames) + added_time_frames
-                )
+                missing_tf = sort_time_frames(list(new_time_frames))
+                enabled_time_frames.update(missing_tf[limit-len(enabled_time_frames):])
         else:
-            all_enabled_time_frames = list(combined_time_frames)
+            enabled_time_frames.update(new_time_frames)
         if has_disabled_time_frames:
             should_update_config = False
             strategy_enabled_time_frames = [
                 tf
                 for tf in config_time_frames
-                if tf in all_enabled_time_frames
+                if tf in enabled_time_frames
             ]
             for time_frame in config_time_frames:
                 if time_frame not in strategy_enabled_time_frames:
@@ -124,6 +134,7 @@ def _apply_time_frames_limits(full_config, logger, limit):
                     strategy_class, tentacles_setup_config, strategy_enabled_time_frames
                 )
     if has_disabled_time_frames:
+        all_enabled_time_frames = sort_time_frames(list(enabled_time_frames))
         return f"Reached maximum allowed simultaneous time frames for this plan, maximum is {limit}. " \
            f"Your OctoBot will trade using following time frames: " \
                f"{', '.join([tf.value for tf in all_enabled_time_frames])}."
@@ -131,6 +142,11 @@ def _apply_time_frames_limits(full_config, logger, limit):
 
 
 def apply_config_limits(configuration) -> list:
+    if constants.MAX_ALLOWED_EXCHANGES == constants.UNLIMITED_ALLOWED \
+            and constants.MAX_ALLOWED_SYMBOLS == constants.UNLIMITED_ALLOWED \
+            and constants.MAX_ALLOWED_TIME_FRAMES == constants.UNLIMITED_ALLOWED:
+        # no limit to apply
+        return []
     logger = logging.get_logger("ConfigurationLimits")
     limit_warning_messages = []
     try:
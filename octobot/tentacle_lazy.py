@@ -0,0 +1,34 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import hashlib
+import os
+
+import octobot.constants as constants
+
+
+def get_tentacles_fingerprint():
+    # identifies the local tentacles install: reference tentacles config content plus
+    # tentacles folder entry mtimes/sizes and the bot version
+    import octobot_tentacles_manager.constants as tentacles_manager_constants
+
+    fingerprint = hashlib.sha1(constants.LONG_VERSION.encode())
+    with open(tentacles_manager_constants.USER_REFERENCE_TENTACLE_CONFIG_FILE_PATH, "rb") as config_file:
+        fingerprint.update(config_file.read())
+    with os.scandir(tentacles_manager_constants.TENTACLES_PATH) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            stats = entry.stat()
+            fingerprint.update(f"{entry.name}:{stats.st_mtime_ns}:{stats.st_size}".encode())
+    return fingerprint.hexdigest()
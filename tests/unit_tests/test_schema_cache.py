@@ -0,0 +1,63 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import json
+import os
+
+import pytest
+
+import octobot._schema_cache as schema_cache
+
+
+@pytest.fixture(autouse=True)
+def clean_schema_cache():
+    schema_cache.clear_cache()
+    yield
+    schema_cache.clear_cache()
+
+
+def _create_schema_file(tmp_path, required=("name",)):
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({
+        "type": "object",
+        "required": list(required),
+    }))
+    return str(schema_file)
+
+
+def test_get_validator_validates(tmp_path):
+    import jsonschema
+
+    validator = schema_cache.get_validator(_create_schema_file(tmp_path))
+    validator.validate({"name": "test"})
+    with pytest.raises(jsonschema.ValidationError):
+        validator.validate({})
+
+
+def test_get_validator_reuses_compiled_validator(tmp_path):
+    schema_path = _create_schema_file(tmp_path)
+    assert schema_cache.get_validator(schema_path) is schema_cache.get_validator(schema_path)
+
+
+def test_get_validator_recompiles_on_schema_change(tmp_path):
+    import jsonschema
+
+    schema_path = _create_schema_file(tmp_path)
+    schema_cache.get_validator(schema_path).validate({"name": "test"})
+
+    _create_schema_file(tmp_path, required=("name", "exchange"))
+    os.utime(schema_path, ns=(1, 1))
+    with pytest.raises(jsonschema.ValidationError):
+        schema_cache.get_validator(schema_path).validate({"name": "test"})
@@ -0,0 +1,106 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2023 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import os
+
+import octobot._validation_cache as validation_cache
+
+
+def _use_tmp_cache_dir(monkeypatch, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setattr(validation_cache, "get_cache_dir", lambda: cache_dir)
+    return cache_dir
+
+
+def _create_tracked_files(tmp_path):
+    config_file = tmp_path / "config.json"
+    profile_file = tmp_path / "profile.json"
+    config_file.write_text('{"trader": {}}')
+    profile_file.write_text('{"profile": {}}')
+    return [str(config_file), str(profile_file)]
+
+
+def test_mark_validated_round_trip(monkeypatch, tmp_path):
+    _use_tmp_cache_dir(monkeypatch, tmp_path)
+    tracked_files = _create_tracked_files(tmp_path)
+
+    assert validation_cache.is_validated(tracked_files) is False
+    validation_cache.mark_validated(tracked_files)
+    assert validation_cache.is_validated(tracked_files) is True
+
+
+def test_is_validated_after_file_change(monkeypatch, tmp_path):
+    _use_tmp_cache_dir(monkeypatch, tmp_path)
+    tracked_files = _create_tracked_files(tmp_path)
+
+    validation_cache.mark_validated(tracked_files)
+    with open(tracked_files[0], "w") as config_file:
+        config_file.write('{"trader": {"enabled": true}}')
+    # digest mismatch: validation is required again
+    assert validation_cache.is_validated(tracked_files) is False
+    validation_cache.mark_validated(tracked_files)
+    assert validation_cache.is_validated(tracked_files) is True
+
+
+def test_is_validated_with_corrupted_marker(monkeypatch, tmp_path):
+    cache_dir = _use_tmp_cache_dir(monkeypatch, tmp_path)
+    tracked_files = _create_tracked_files(tmp_path)
+
+    validation_cache.mark_validated(tracked_files)
+    with open(os.path.join(cache_dir, "validated.json"), "w") as marker_file:
+        marker_file.write("{ not json")
+    # corrupted marker falls through to a normal validation
+    assert validation_cache.is_validated(tracked_files) is False
+
+
+def test_is_validated_with_missing_tracked_file(monkeypatch, tmp_path):
+    _use_tmp_cache_dir(monkeypatch, tmp_path)
+    tracked_files = _create_tracked_files(tmp_path)
+
+    validation_cache.mark_validated(tracked_files)
+    os.remove(tracked_files[1])
+    assert validation_cache.is_validated(tracked_files) is False
+
+
+def test_mark_validated_with_unwritable_cache_dir(monkeypatch, tmp_path):
+    read_only_file = tmp_path / "not_a_dir"
+    read_only_file.write_text("")
+    monkeypatch.setattr(validation_cache, "get_cache_dir", lambda: str(read_only_file))
+    tracked_files = _create_tracked_files(tmp_path)
+
+    # does not raise, next startup validates again
+    validation_cache.mark_validated(tracked_files)
+    assert validation_cache.is_validated(tracked_files) is False
+
+
+def test_get_tracked_files(monkeypatch, tmp_path):
+    profiles_dir = tmp_path / "profiles" / "default"
+    os.makedirs(profiles_dir)
+    profile_file = profiles_dir / "profile.json"
+    profile_file.write_text("{}")
+    (profiles_dir / "notes.txt").write_text("ignored")
+    config_file = tmp_path / "config.json"
+    config_file.write_text("{}")
+
+    class _Config:
+        config_path = str(config_file)
+        profiles_path = str(tmp_path / "profiles")
+
+    tracked_files = validation_cache.get_tracked_files(_Config())
+    assert validation_cache.constants.CONFIG_FILE_SCHEMA in tracked_files
+    assert validation_cache.constants.PROFILE_FILE_SCHEMA in tracked_files
+    assert str(config_file) in tracked_files
+    assert str(profile_file) in tracked_files
+    assert all(not tracked.endswith(".txt") for tracked in tracked_files)